@@ -1,21 +1,42 @@
 import asyncio
-import itertools
 import logging
 import os
-import sys
 from types import ModuleType
 from typing import Optional
 
 import aiohttp
-import asyncpg
-import discord
-import pkg_resources
 from discord.ext import commands
-from discord.utils import cached_property
+
+__all__ = ["AviBot"]
+
+_CORE_DIR: str = os.path.dirname(os.path.realpath(__file__))
+_BOT_DIR: str = os.path.dirname(_CORE_DIR)
+_DATA_DIR: str = os.path.join(_BOT_DIR, "data")
+_EXT_DIR: str = os.path.join(_BOT_DIR, "exts")
+_TOKEN: Optional[str] = os.getenv("DISCORD_TOKEN")
+
+_HTTP_LIMIT: int = 64
+_HTTP_LIMIT_PER_HOST: int = 16
+_HTTP_DNS_CACHE_TTL: int = 300
+_HTTP_KEEPALIVE_TIMEOUT: float = 60
+_HTTP_TIMEOUT: float = 30
 
 
 class AviBot(commands.Bot):
     """This class implements AviBot."""
+    __slots__ = (
+        "config",
+        "prefix",
+        "owner",
+        "core_dir",
+        "bot_dir",
+        "data_dir",
+        "ext_dir",
+        "token",
+        "session",
+        "logger",
+    )
+
     def __init__(
         self,
         config: ModuleType,
@@ -26,22 +47,48 @@ class AviBot(commands.Bot):
         self.prefix = config.bot_prefix
         super().__init__(command_prefix=self.prefix, loop=loop)
         self.owner: int = config.bot_owner
-        self.core_dir: str = os.path.dirname(os.path.realpath(__file__))
-        self.bot_dir: str = os.path.dirname(self.core_dir)
-        self.data_dir: str = os.path.join(self.bot_dir, "data")
-        self.ext_dir: str = os.path.join(self.bot_dir, "exts")
-        self.token: Optional[str] = os.getenv("DISCORD_TOKEN")
+        self.core_dir: str = _CORE_DIR
+        self.bot_dir: str = _BOT_DIR
+        self.data_dir: str = _DATA_DIR
+        self.ext_dir: str = _EXT_DIR
+        self.token: Optional[str] = _TOKEN
         self.session: Optional[aiohttp.ClientSession] = None
         self.logger: logging.Logger = logging.getLogger("avibot")
 
     async def _create_session(self):
-        self.session = aiohttp.ClientSession(loop=self.loop)
+        connector = aiohttp.TCPConnector(
+            limit=_HTTP_LIMIT,
+            limit_per_host=_HTTP_LIMIT_PER_HOST,
+            use_dns_cache=True,
+            ttl_dns_cache=_HTTP_DNS_CACHE_TTL,
+            keepalive_timeout=_HTTP_KEEPALIVE_TIMEOUT,
+            loop=self.loop,
+        )
+        self.session = aiohttp.ClientSession(
+            connector=connector,
+            loop=self.loop,
+            timeout=aiohttp.ClientTimeout(total=_HTTP_TIMEOUT),
+        )
 
-    async def shutdown(self):
-        await self.logout()
-        if self.session:
+    async def _close_session(self):
+        if self.session and not self.session.closed:
             await self.session.close()
 
+    async def start(self, *args, **kwargs):
+        if self.session is None or self.session.closed:
+            await self._create_session()
+        try:
+            await super().start(*args, **kwargs)
+        finally:
+            await self._close_session()
+
+    async def close(self):
+        await self._close_session()
+        await super().close()
+
+    async def shutdown(self):
+        await self.close()
+
     @property
     def name(self):
         return self.user.name
@@ -55,7 +102,7 @@ class AviBot(commands.Bot):
         return self.user.avatar_url_as(static_format="png", size=64)
 
     async def on_ready(self):
-        print("AviBot")
+        self.logger.info("Ready as %s (id=%s)", self.user, self.user.id)
 
-    def run(self):
-        super().run(self.token)
+    def run(self, *args, **kwargs):
+        super().run(self.token, *args, **kwargs)
@@ -1,29 +1,33 @@
 """Launcher Module."""
 import asyncio
 import logging
+import os
 
-import config
-from avibot import AviBot
-
-try:
+if os.getenv("AVIBOT_NO_UVLOOP", "").lower() not in ("1", "true", "yes"):
     import uvloop
-except ImportError:
-    pass
-else:
+
     asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
 
+import config
+from avibot import AviBot
+
 logger = logging.getLogger(__name__)
 
 
 def run_bot():
     """Run the bot."""
-    loop = asyncio.get_event_loop()
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
     bot = AviBot(config, loop=loop)
     bot.run()
 
 
 def main():
     """Launch the bot."""
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+    )
     run_bot()
 
 
@@ -0,0 +1,41 @@
+import asyncio
+from unittest import mock
+
+from discord.ext import commands
+
+import config
+from avibot import AviBot
+
+
+def test_start_creates_and_closes_session():
+    loop = asyncio.new_event_loop()
+    bot = AviBot(config, loop=loop)
+    sessions = []
+
+    def fake_start(*args, **kwargs):
+        sessions.append(bot.session)
+        assert not bot.session.closed
+
+    with mock.patch.object(
+        commands.Bot, "start", mock.AsyncMock(side_effect=fake_start)
+    ) as start:
+        loop.run_until_complete(bot.start("token"))
+
+    start.assert_awaited_once_with("token")
+    assert len(sessions) == 1
+    assert sessions[0].closed
+    loop.close()
+
+
+def test_close_closes_session():
+    loop = asyncio.new_event_loop()
+    bot = AviBot(config, loop=loop)
+    loop.run_until_complete(bot._create_session())
+    session = bot.session
+
+    with mock.patch.object(commands.Bot, "close", mock.AsyncMock()) as close:
+        loop.run_until_complete(bot.close())
+
+    close.assert_awaited_once_with()
+    assert session.closed
+    loop.close()
@@ -1,4 +1,4 @@
 #!/bin/bash
 
-export $(cat avibot.env | xargs)
-export $(cat postgres.env | xargs)
+export $(grep -v "^#" avibot.env | xargs)
+export $(grep -v "^#" postgres.env | xargs)